@@ -1,32 +1,128 @@
 import asyncio
-import json
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 
 import aiohttp
-import aiohttp_cors
+import orjson
 from aiohttp import web
 from dotenv import load_dotenv
-from jira import JIRA
-from jira.exceptions import JIRAError
 
-# Configure logging
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+# Configure logging; records are queued and written out by a background listener
+log_queue: queue.Queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
+    format='%(message)s',  # Full formatting is done by the listener's handlers
+    handlers=[logging.handlers.QueueHandler(log_queue)]
+)
+logger = logging.getLogger(__name__)
+
+def create_log_listener() -> logging.handlers.QueueListener:
+    """Create the listener that writes queued log records to the console and log file."""
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
         logging.StreamHandler(),
         logging.FileHandler('mcp_server.log')
     ]
-)
-logger = logging.getLogger(__name__)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return logging.handlers.QueueListener(log_queue, *handlers)
 
 # Load environment variables
 load_dotenv()
 
+# Largest request body accepted, in bytes
+MAX_BODY_SIZE = 1024 * 1024
+
+# Maximum number of MCP messages accepted in a single batch request
+MAX_BATCH_SIZE = 50
+
+# Most get_my_issues responses kept in the cache at once
+MAX_MY_ISSUES_CACHE_SIZE = 256
+
+# Returned when a message carries no command; callers never mutate responses
+NO_COMMAND_ERROR = {'status': 'error', 'message': 'No command specified'}
+
+# Largest page of search results ever requested from Jira
+MAX_PAGE_SIZE = 100
+
+# Issue fields requested from Jira; covers everything the handlers return
+ISSUE_FIELDS = 'summary,description,status,created,updated,assignee,priority,issuetype,project,duedate,reporter'
+
+# CORS headers added to every response
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST, GET, OPTIONS',
+    'Access-Control-Allow-Headers': '*',
+    'Access-Control-Expose-Headers': '*'
+}
+
+# Fields and directions issue listings may be sorted by
+SORT_FIELDS = frozenset({'created', 'updated', 'priority', 'status', 'duedate'})
+SORT_ORDERS = frozenset({'ASC', 'DESC'})
+
+# JQL clause templates; values must be passed through escape_jql()
+MY_ISSUES_JQL = 'assignee = currentUser()'
+STATUS_JQL = 'status = "{}"'
+PROJECT_JQL = 'project = "{}"'
+ORDER_BY_JQL = ' ORDER BY {} {}'
+SEARCH_TITLE_JQL = 'summary ~ "{q}" AND issuetype != Epic'
+SEARCH_ALL_JQL = '(summary ~ "{q}" OR description ~ "{q}") AND issuetype != Epic'
+EPIC_SEARCH_JQL = 'issuetype = Epic AND (summary ~ "{q}" OR summary = "{q}")'
+EPIC_SUBTASKS_JQL = '"Epic Link" = {} ORDER BY created DESC'
+
+# Matches Jira issue keys such as "PROJ-123"
+ISSUE_KEY_PATTERN = re.compile(r'^[A-Z][A-Z0-9_]*-\d+$')
+
+# Shortest text Jira's full-text search will match on
+MIN_SEARCH_LENGTH = 3
+
+# Last second formatted by iso_now() and its ISO 8601 string
+_timestamp_cache: List[Any] = [0, '']
+
+def iso_now() -> str:
+    """Current UTC time as an ISO 8601 string, formatted at most once per second."""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[:] = [now, datetime.utcfromtimestamp(now).isoformat()]
+    return _timestamp_cache[1]
+
+def cache_put(
+    cache: 'OrderedDict[Any, Tuple[float, Any]]',
+    key: Any,
+    value: Any,
+    ttl: float,
+    max_size: Optional[int] = None
+) -> None:
+    """Store a (timestamp, value) entry, first evicting entries older than ttl.
+
+    If max_size is given, the oldest entries are also evicted to keep the cache within it.
+    """
+    now = time.monotonic()
+    # Entries are kept in insertion order, so the oldest ones are at the front
+    while cache and now - next(iter(cache.values()))[0] >= ttl:
+        cache.popitem(last=False)
+    cache.pop(key, None)
+    while max_size is not None and cache and len(cache) >= max_size:
+        cache.popitem(last=False)
+    cache[key] = (now, value)
+
+def escape_jql(value: str) -> str:
+    """Escape a value for use inside a double-quoted JQL string."""
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
 @dataclass
 class ServerConfig:
     port: int = int(os.getenv('MCP_SERVER_PORT', 8000))
@@ -41,6 +137,17 @@ class JiraConfig:
     token: str
     timeout: int = 30
     max_results: int = 50
+    issue_ttl: int = 60
+    transitions_ttl: int = 15
+    my_issues_ttl: int = 30
+    max_concurrency: int = 16
+
+class JIRAError(Exception):
+    """Error response returned by the Jira REST API."""
+    def __init__(self, status_code: int, text: str):
+        super().__init__(f'{status_code} - {text}')
+        self.status_code = status_code
+        self.text = text
 
 class MCPJiraServer:
     def __init__(self):
@@ -49,44 +156,156 @@ class MCPJiraServer:
             user=os.getenv('JIRA_USER', ''),
             token=os.getenv('JIRA_TOKEN', ''),
             timeout=int(os.getenv('JIRA_TIMEOUT', '30')),
-            max_results=int(os.getenv('JIRA_MAX_RESULTS', '50'))
+            max_results=min(int(os.getenv('JIRA_MAX_RESULTS', '50')), MAX_PAGE_SIZE),
+            issue_ttl=int(os.getenv('JIRA_ISSUE_TTL', '60')),
+            transitions_ttl=int(os.getenv('JIRA_TRANSITIONS_TTL', '15')),
+            my_issues_ttl=int(os.getenv('JIRA_MY_ISSUES_TTL', '30')),
+            max_concurrency=int(os.getenv('JIRA_MAX_CONCURRENCY', '16'))
         )
         if not all([self.config.server, self.config.user, self.config.token]):
             raise ValueError('Missing required JIRA configuration')
-        
-        self.jira = JIRA(
-            server=self.config.server,
-            basic_auth=(self.config.user, self.config.token),
-            timeout=self.config.timeout
+
+        self.api_url = f"{self.config.server.rstrip('/')}/rest/api/2"
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._jira_sem: Optional[asyncio.Semaphore] = None
+
+        # Caches keyed by upper-cased issue key, holding (fetched_at, value) pairs
+        self._issue_cache: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._transitions_cache: 'OrderedDict[str, Tuple[float, Tuple[str, List[Dict[str, Any]]]]]' = OrderedDict()
+
+        # get_my_issues responses keyed by user and query parameters
+        self._my_issues_cache: 'OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._account_id: Optional[str] = None
+
+        # Command name -> handler
+        self._handlers = {
+            'create_issue': self._create_issue,
+            'get_issue': self._get_issue,
+            'update_issue': self._update_issue,
+            'delete_issue': self._delete_issue,
+            'search_issues': self._search_issues,
+            'get_epic_with_subtasks': self._get_epic_with_subtasks,
+            'get_my_issues': self._get_my_issues,
+            'get_transitions': self._get_transitions,
+            'get_issues_by_status': self._get_issues_by_status
+        }
+
+    async def setup(self) -> None:
+        """Open the shared HTTP session used for all Jira calls."""
+        # Bounds the number of Jira requests in flight at once
+        self._jira_sem = asyncio.Semaphore(self.config.max_concurrency)
+        self.session = aiohttp.ClientSession(
+            auth=aiohttp.BasicAuth(self.config.user, self.config.token),
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            # All traffic goes to a single Jira host, so keep a large pool of
+            # persistent connections to it and reuse DNS results
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=200,
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+                keepalive_timeout=300,
+                force_close=False
+            )
         )
-        
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request to the Jira REST API and return the decoded JSON body."""
+        async with self._jira_sem:
+            async with self.session.request(method, f'{self.api_url}/{path}', **kwargs) as resp:
+                if resp.status >= 400:
+                    raise JIRAError(resp.status, await resp.text())
+                if resp.status == 204:
+                    return None
+                return orjson.loads(await resp.read())
+
+    async def _fetch_issue(self, issue_key: str) -> Dict[str, Any]:
+        """Fetch a single issue."""
+        return await self._request('GET', f'issue/{issue_key}', params={'fields': ISSUE_FIELDS})
+
+    async def _get_cached_issue(self, issue_key: str) -> Dict[str, Any]:
+        """Fetch a single issue, serving it from the cache while it is fresh."""
+        issue_key = issue_key.upper()
+        cached = self._issue_cache.get(issue_key)
+        if cached and time.monotonic() - cached[0] < self.config.issue_ttl:
+            return cached[1]
+
+        issue = await self._fetch_issue(issue_key)
+        cache_put(self._issue_cache, issue_key, issue, self.config.issue_ttl)
+        return issue
+
+    async def _get_cached_transitions(self, issue_key: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """Get the current status and available transitions of an issue, cached briefly."""
+        issue_key = issue_key.upper()
+        cached = self._transitions_cache.get(issue_key)
+        if cached and time.monotonic() - cached[0] < self.config.transitions_ttl:
+            return cached[1]
+
+        issue, transitions = await asyncio.gather(
+            self._fetch_issue(issue_key),
+            self._fetch_transitions(issue_key)
+        )
+        cache_put(self._issue_cache, issue_key, issue, self.config.issue_ttl)
+        result = (issue['fields']['status']['name'], transitions)
+        cache_put(self._transitions_cache, issue_key, result, self.config.transitions_ttl)
+        return result
+
+    def _invalidate_issue(self, issue_key: str) -> None:
+        """Drop any cached data for an issue after it has been modified."""
+        issue_key = issue_key.upper()
+        self._issue_cache.pop(issue_key, None)
+        self._transitions_cache.pop(issue_key, None)
+        self._my_issues_cache.clear()
+
+    async def _get_account_id(self) -> str:
+        """Get the identity of the authenticated user, resolving it on first use."""
+        if self._account_id is None:
+            myself = await self._request('GET', 'myself')
+            # Jira Cloud identifies users by accountId, Jira Server by name
+            self._account_id = myself.get('accountId') or myself['name']
+        return self._account_id
+
+    async def _search(self, jql: str, start_at: int = 0, max_results: int = 50) -> Dict[str, Any]:
+        """Run a JQL search and return the raw search result."""
+        return await self._request('GET', 'search', params={
+            'jql': jql,
+            'startAt': start_at,
+            'maxResults': min(max_results, MAX_PAGE_SIZE),
+            'validateQuery': 'strict',
+            'fields': ISSUE_FIELDS
+        })
+
+    async def _search_epic_subtasks(self, epic_key: str, start_at: int, max_results: int) -> Dict[str, Any]:
+        """Search for the issues linked to an epic, newest first."""
+        return await self._search(
+            EPIC_SUBTASKS_JQL.format(epic_key),
+            start_at=start_at,
+            max_results=max_results
+        )
+
+    async def _fetch_transitions(self, issue_key: str) -> List[Dict[str, Any]]:
+        """Fetch the transitions available for an issue."""
+        data = await self._request('GET', f'issue/{issue_key}/transitions')
+        return data['transitions']
+
     async def handle_mcp_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Handle incoming MCP messages and interact with Jira."""
         try:
             command = message.get('command')
             if not command:
-                return {'status': 'error', 'message': 'No command specified'}
-
-            if command == 'create_issue':
-                return await self._create_issue(message)
-            elif command == 'get_issue':
-                return await self._get_issue(message)
-            elif command == 'update_issue':
-                return await self._update_issue(message)
-            elif command == 'delete_issue':
-                return await self._delete_issue(message)
-            elif command == 'search_issues':
-                return await self._search_issues(message)
-            elif command == 'get_epic_with_subtasks':
-                return await self._get_epic_with_subtasks(message)
-            elif command == 'get_my_issues':
-                return await self._get_my_issues(message)
-            elif command == 'get_transitions':
-                return await self._get_transitions(message)
-            elif command == 'get_issues_by_status':
-                return await self._get_issues_by_status(message)
-            else:
+                return NO_COMMAND_ERROR
+
+            handler = self._handlers.get(command)
+            if handler is None:
                 return {'status': 'error', 'message': f'Unknown command: {command}'}
+            return await handler(message)
 
         except Exception as e:
             logger.error(f"Error processing message: {str(e)}")
@@ -108,20 +327,23 @@ class MCPJiraServer:
         # Handle parent for subtasks
         if data.get('issuetype') == 'Sub-task' and data.get('parent'):
             try:
-                parent_issue = self.jira.issue(data['parent'])
-                issue_dict['parent'] = {'key': parent_issue.key}
+                parent_issue = await self._get_cached_issue(data['parent'])
+                issue_dict['parent'] = {'key': parent_issue['key']}
             except JIRAError as e:
                 logger.error(f'Error getting parent issue: {str(e)}')
                 return {'status': 'error', 'message': f'Invalid parent issue: {str(e)}'}
 
         try:
-            issue = self.jira.create_issue(fields=issue_dict)
+            issue = await self._request('POST', 'issue', json={'fields': issue_dict})
+            if 'parent' in issue_dict:
+                self._invalidate_issue(issue_dict['parent']['key'])
+            self._my_issues_cache.clear()
             return {
                 'status': 'success',
                 'data': {
-                    'issue_key': issue.key,
-                    'issue_id': issue.id,
-                    'self': issue.self
+                    'issue_key': issue['key'],
+                    'issue_id': issue['id'],
+                    'self': issue['self']
                 }
             }
         except JIRAError as e:
@@ -137,14 +359,15 @@ class MCPJiraServer:
         if not issue_key:
             return {'status': 'error', 'message': 'Missing issue key'}
 
-        issue = self.jira.issue(issue_key)
+        issue = await self._get_cached_issue(issue_key)
+        fields = issue['fields']
         return {
             'status': 'success',
             'data': {
-                'issue_key': issue.key,
-                'summary': issue.fields.summary,
-                'description': issue.fields.description,
-                'status': issue.fields.status.name
+                'issue_key': issue['key'],
+                'summary': fields['summary'],
+                'description': fields['description'],
+                'status': fields['status']['name']
             }
         }
 
@@ -163,11 +386,9 @@ class MCPJiraServer:
         if 'parent' in data:
             update_fields['parent'] = {'key': data['parent']}
 
-        issue = self.jira.issue(issue_key)
-        
         # Handle status update
         if 'status' in data:
-            transitions = self.jira.transitions(issue)
+            transitions = await self._fetch_transitions(issue_key)
             target_status = data['status'].lower()
             transition_id = None
             available_transitions = []
@@ -180,7 +401,12 @@ class MCPJiraServer:
                     break
             
             if transition_id:
-                self.jira.transition_issue(issue, transition_id)
+                await self._request(
+                    'POST',
+                    f'issue/{issue_key}/transitions',
+                    json={'transition': {'id': transition_id}}
+                )
+                self._invalidate_issue(issue_key)
             else:
                 suggestion_msg = f"Available status transitions are: {', '.join(available_transitions)}"
                 return {
@@ -190,7 +416,8 @@ class MCPJiraServer:
 
         # Update other fields if any
         if update_fields:
-            issue.update(fields=update_fields)
+            await self._request('PUT', f'issue/{issue_key}', json={'fields': update_fields})
+            self._invalidate_issue(issue_key)
             
         return {'status': 'success', 'message': f'Updated issue {issue_key}'}
 
@@ -202,8 +429,8 @@ class MCPJiraServer:
             return {'status': 'error', 'message': 'Missing issue key'}
 
         try:
-            issue = self.jira.issue(issue_key)
-            issue.delete()
+            await self._request('DELETE', f'issue/{issue_key}')
+            self._invalidate_issue(issue_key)
             return {
                 'status': 'success',
                 'message': f'Successfully deleted issue {issue_key}'
@@ -236,46 +463,45 @@ class MCPJiraServer:
         
         if not search_text:
             return {'status': 'error', 'message': 'Missing search text'}
+        if len(search_text.strip()) < MIN_SEARCH_LENGTH:
+            return {'status': 'error', 'message': f'Search text must be at least {MIN_SEARCH_LENGTH} characters'}
 
         try:
             # Build JQL query
-            if title_only:
-                jql = f'summary ~ "{search_text}" AND issuetype != Epic'
-            else:
-                jql = f'(summary ~ "{search_text}" OR description ~ "{search_text}") AND issuetype != Epic'
+            jql = (SEARCH_TITLE_JQL if title_only else SEARCH_ALL_JQL).format(q=escape_jql(search_text))
 
             # Calculate pagination
             start_at = (page - 1) * page_size
             
             # Fetch issues with pagination
-            issues = self.jira.search_issues(
+            issues = await self._search(
                 jql,
-                startAt=start_at,
-                maxResults=page_size,
-                validate_query=True
+                start_at=start_at,
+                max_results=page_size
             )
             
             # Process results
             results = [{
-                'key': issue.key,
-                'summary': issue.fields.summary,
-                'description': issue.fields.description,
-                'status': issue.fields.status.name,
-                'created': str(issue.fields.created),
-                'updated': str(issue.fields.updated),
-                'assignee': str(issue.fields.assignee) if issue.fields.assignee else None
-            } for issue in issues]
+                'key': issue['key'],
+                'summary': (fields := issue['fields'])['summary'],
+                'description': fields['description'],
+                'status': fields['status']['name'],
+                'created': fields['created'],
+                'updated': fields['updated'],
+                'assignee': assignee['displayName'] if (assignee := fields.get('assignee')) else None
+            } for issue in issues['issues']]
             
             # Add pagination info
+            total = issues['total']
             return {
                 'status': 'success',
                 'data': {
                     'issues': results,
                     'pagination': {
-                        'total': issues.total,
+                        'total': total,
                         'page': page,
                         'page_size': page_size,
-                        'total_pages': (issues.total + page_size - 1) // page_size
+                        'total_pages': -(-total // page_size)
                     }
                 }
             }
@@ -295,7 +521,7 @@ class MCPJiraServer:
         
         Args:
             message: Dictionary containing search parameters
-                - epic_name: Name of the epic to search for
+                - epic_name: Name or issue key of the epic to search for
                 - page: Page number for subtasks (optional)
                 - page_size: Results per page for subtasks (optional)
         
@@ -311,60 +537,77 @@ class MCPJiraServer:
             return {'status': 'error', 'message': 'Missing epic name'}
 
         try:
-            # First find the epic with exact and fuzzy match
-            epic_jql = f'issuetype = Epic AND (summary ~ "{epic_name}" OR summary = "{epic_name}")'            
-            epics = self.jira.search_issues(epic_jql, maxResults=5)  # Limit to top 5 matches
-            
-            if not epics:
-                return {'status': 'error', 'message': f'No epic found with name containing "{epic_name}"'}
-
-            # If we have multiple matches, prefer exact match or take the first one
-            epic = next(
-                (e for e in epics if e.fields.summary.lower() == epic_name.lower()),
-                epics[0]
-            )
-            
             # Calculate pagination for subtasks
             start_at = (page - 1) * page_size
-            
-            # Then find all issues linked to this epic with pagination
-            subtasks_jql = f'"Epic Link" = {epic.key} ORDER BY created DESC'
-            subtasks = self.jira.search_issues(
-                subtasks_jql,
-                startAt=start_at,
-                maxResults=page_size,
-                validate_query=True
-            )
+            epic = None
+            subtasks = None
+
+            # If we were given an issue key, fetch the epic and its subtasks concurrently
+            if ISSUE_KEY_PATTERN.match(epic_name):
+                epic_key = epic_name
+                epic_result, subtasks_result = await asyncio.gather(
+                    self._get_cached_issue(epic_key),
+                    self._search_epic_subtasks(epic_key, start_at, page_size),
+                    return_exceptions=True
+                )
+                # A missing issue or a non-epic falls back to searching by name
+                if isinstance(epic_result, JIRAError) and epic_result.status_code == 404:
+                    pass
+                elif isinstance(epic_result, BaseException):
+                    raise epic_result
+                elif epic_result['fields']['issuetype']['name'] == 'Epic':
+                    if isinstance(subtasks_result, BaseException):
+                        raise subtasks_result
+                    epic, subtasks = epic_result, subtasks_result
+
+            if epic is None:
+                # First find the epic with exact and fuzzy match
+                epic_jql = EPIC_SEARCH_JQL.format(q=escape_jql(epic_name))
+                epics = (await self._search(epic_jql, max_results=5))['issues']  # Limit to top 5 matches
+
+                if not epics:
+                    return {'status': 'error', 'message': f'No epic found with name containing "{epic_name}"'}
+
+                # If we have multiple matches, prefer exact match or take the first one
+                epic = next(
+                    (e for e in epics if e['fields']['summary'].lower() == epic_name.lower()),
+                    epics[0]
+                )
 
+                # Then find all issues linked to this epic with pagination
+                subtasks = await self._search_epic_subtasks(epic['key'], start_at, page_size)
+
+            epic_fields = epic['fields']
+            total = subtasks['total']
             result = {
                 'epic': {
-                    'key': epic.key,
-                    'summary': epic.fields.summary,
-                    'description': epic.fields.description,
-                    'status': epic.fields.status.name,
-                    'created': str(epic.fields.created),
-                    'updated': str(epic.fields.updated),
-                    'assignee': str(epic.fields.assignee) if epic.fields.assignee else None,
-                    'reporter': str(epic.fields.reporter) if epic.fields.reporter else None,
-                    'priority': str(epic.fields.priority) if epic.fields.priority else None
+                    'key': epic['key'],
+                    'summary': epic_fields['summary'],
+                    'description': epic_fields['description'],
+                    'status': epic_fields['status']['name'],
+                    'created': epic_fields['created'],
+                    'updated': epic_fields['updated'],
+                    'assignee': assignee['displayName'] if (assignee := epic_fields.get('assignee')) else None,
+                    'reporter': reporter['displayName'] if (reporter := epic_fields.get('reporter')) else None,
+                    'priority': priority['name'] if (priority := epic_fields.get('priority')) else None
                 },
                 'subtasks': {
                     'issues': [{
-                        'key': task.key,
-                        'summary': task.fields.summary,
-                        'description': task.fields.description,
-                        'status': task.fields.status.name,
-                        'issuetype': task.fields.issuetype.name,
-                        'created': str(task.fields.created),
-                        'updated': str(task.fields.updated),
-                        'assignee': str(task.fields.assignee) if task.fields.assignee else None,
-                        'priority': str(task.fields.priority) if task.fields.priority else None
-                    } for task in subtasks],
+                        'key': task['key'],
+                        'summary': (fields := task['fields'])['summary'],
+                        'description': fields['description'],
+                        'status': fields['status']['name'],
+                        'issuetype': fields['issuetype']['name'],
+                        'created': fields['created'],
+                        'updated': fields['updated'],
+                        'assignee': assignee['displayName'] if (assignee := fields.get('assignee')) else None,
+                        'priority': priority['name'] if (priority := fields.get('priority')) else None
+                    } for task in subtasks['issues']],
                     'pagination': {
-                        'total': subtasks.total,
+                        'total': total,
                         'page': page,
                         'page_size': page_size,
-                        'total_pages': (subtasks.total + page_size - 1) // page_size
+                        'total_pages': -(-total // page_size)
                     }
                 }
             }
@@ -403,64 +646,80 @@ class MCPJiraServer:
             project = data.get('project')
             sort_by = data.get('sort_by', 'updated')
             sort_order = data.get('sort_order', 'DESC').upper()
+            if sort_order not in SORT_ORDERS:
+                sort_order = 'DESC'
+
+            # Serve repeated queries from the cache while fresh
+            cache_key = (await self._get_account_id(), status, project, sort_by, sort_order, page, page_size)
+            cached = self._my_issues_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.config.my_issues_ttl:
+                return dict(cached[1])
             
             # Build JQL query
-            jql_parts = ['assignee = currentUser()']
+            jql_parts = [MY_ISSUES_JQL]
             
             if status:
-                jql_parts.append(f'status = "{status}"')
+                jql_parts.append(STATUS_JQL.format(escape_jql(status)))
             if project:
-                jql_parts.append(f'project = "{project}"')
+                jql_parts.append(PROJECT_JQL.format(escape_jql(project)))
                 
             jql = ' AND '.join(jql_parts)
             
             # Add sorting
-            if sort_by in ['created', 'updated', 'priority', 'status', 'duedate']:
-                jql += f' ORDER BY {sort_by} {sort_order}'
+            if sort_by in SORT_FIELDS:
+                jql += ORDER_BY_JQL.format(sort_by, sort_order)
             
             # Calculate pagination
             start_at = (page - 1) * page_size
             
             # Fetch issues
-            issues = self.jira.search_issues(
+            issues = await self._search(
                 jql,
-                startAt=start_at,
-                maxResults=page_size,
-                validate_query=True
+                start_at=start_at,
+                max_results=page_size
             )
             
             # Process results
             results = [{
-                'key': issue.key,
-                'summary': issue.fields.summary,
-                'description': issue.fields.description,
-                'status': issue.fields.status.name,
-                'created': str(issue.fields.created),
-                'updated': str(issue.fields.updated),
-                'priority': str(issue.fields.priority) if issue.fields.priority else None,
+                'key': issue['key'],
+                'summary': (fields := issue['fields'])['summary'],
+                'description': fields['description'],
+                'status': fields['status']['name'],
+                'created': fields['created'],
+                'updated': fields['updated'],
+                'priority': priority['name'] if (priority := fields.get('priority')) else None,
                 'project': {
-                    'key': issue.fields.project.key,
-                    'name': issue.fields.project.name
+                    'key': fields['project']['key'],
+                    'name': fields['project']['name']
                 },
                 'issuetype': {
-                    'name': issue.fields.issuetype.name,
-                    'subtask': issue.fields.issuetype.subtask
+                    'name': fields['issuetype']['name'],
+                    'subtask': fields['issuetype']['subtask']
                 },
-                'duedate': str(issue.fields.duedate) if hasattr(issue.fields, 'duedate') and issue.fields.duedate else None
-            } for issue in issues]
+                'duedate': fields.get('duedate')
+            } for issue in issues['issues']]
             
-            return {
+            total = issues['total']
+            response = {
                 'status': 'success',
                 'data': {
                     'issues': results,
                     'pagination': {
-                        'total': issues.total,
+                        'total': total,
                         'page': page,
                         'page_size': page_size,
-                        'total_pages': (issues.total + page_size - 1) // page_size
+                        'total_pages': -(-total // page_size)
                     }
                 }
             }
+            cache_put(
+                self._my_issues_cache,
+                cache_key,
+                response,
+                self.config.my_issues_ttl,
+                max_size=MAX_MY_ISSUES_CACHE_SIZE
+            )
+            return dict(response)
             
         except JIRAError as e:
             logger.error(f'JIRA API error in get_my_issues: {e.status_code} - {e.text}')
@@ -478,11 +737,9 @@ class MCPJiraServer:
         if not issue_key:
             return {'status': 'error', 'message': 'Missing issue key'}
 
-        issue = self.jira.issue(issue_key)
-        transitions = self.jira.transitions(issue)
+        current_status, transitions = await self._get_cached_transitions(issue_key)
         
         # Group transitions by current and next possible statuses
-        current_status = issue.fields.status.name
         next_possible = sorted(list(set(t['to']['name'] for t in transitions)))
         
         return {
@@ -527,57 +784,59 @@ class MCPJiraServer:
             page_size = min(self.config.max_results, int(data.get('page_size', 20)))
             sort_by = data.get('sort_by', 'updated')
             sort_order = data.get('sort_order', 'DESC').upper()
+            if sort_order not in SORT_ORDERS:
+                sort_order = 'DESC'
             
             if not status:
                 return {'status': 'error', 'message': 'Missing status parameter'}
 
             # Build JQL query
-            jql = f'status = "{status}"'
+            jql = STATUS_JQL.format(escape_jql(status))
             
             # Add sorting
-            if sort_by in ['created', 'updated', 'priority', 'status', 'duedate']:
-                jql += f' ORDER BY {sort_by} {sort_order}'
+            if sort_by in SORT_FIELDS:
+                jql += ORDER_BY_JQL.format(sort_by, sort_order)
             
             # Calculate pagination
             start_at = (page - 1) * page_size
             
             # Fetch issues
-            issues = self.jira.search_issues(
+            issues = await self._search(
                 jql,
-                startAt=start_at,
-                maxResults=page_size,
-                validate_query=True
+                start_at=start_at,
+                max_results=page_size
             )
             
             # Process results
             results = [{
-                'key': issue.key,
-                'summary': issue.fields.summary,
-                'description': issue.fields.description,
-                'status': issue.fields.status.name,
-                'created': str(issue.fields.created),
-                'updated': str(issue.fields.updated),
-                'priority': str(issue.fields.priority) if issue.fields.priority else None,
+                'key': issue['key'],
+                'summary': (fields := issue['fields'])['summary'],
+                'description': fields['description'],
+                'status': fields['status']['name'],
+                'created': fields['created'],
+                'updated': fields['updated'],
+                'priority': priority['name'] if (priority := fields.get('priority')) else None,
                 'project': {
-                    'key': issue.fields.project.key,
-                    'name': issue.fields.project.name
+                    'key': fields['project']['key'],
+                    'name': fields['project']['name']
                 },
                 'issuetype': {
-                    'name': issue.fields.issuetype.name,
-                    'subtask': issue.fields.issuetype.subtask
+                    'name': fields['issuetype']['name'],
+                    'subtask': fields['issuetype']['subtask']
                 },
-                'duedate': str(issue.fields.duedate) if hasattr(issue.fields, 'duedate') and issue.fields.duedate else None
-            } for issue in issues]
+                'duedate': fields.get('duedate')
+            } for issue in issues['issues']]
             
+            total = issues['total']
             return {
                 'status': 'success',
                 'data': {
                     'issues': results,
                     'pagination': {
-                        'total': issues.total,
+                        'total': total,
                         'page': page,
                         'page_size': page_size,
-                        'total_pages': (issues.total + page_size - 1) // page_size
+                        'total_pages': -(-total // page_size)
                     }
                 }
             }
@@ -595,52 +854,115 @@ class MCPJiraServer:
     async def test_connection(self):
         """Test Jira connection."""
         try:
-            self.jira.myself()
+            await self._request('GET', 'myself')
             return True
         except Exception as e:
             logger.error(f"Jira connection test failed: {e}")
             raise
 
-async def validate_request(request: web.Request) -> Tuple[bool, Optional[str]]:
-    """Validate incoming requests."""
+def json_response(data: Any, status: int = 200) -> web.Response:
+    """Build a JSON response serialized with orjson."""
+    return web.Response(body=orjson.dumps(data), status=status, content_type='application/json')
+
+async def parse_request(request: web.Request) -> Tuple[Any, Optional[web.Response]]:
+    """Validate and decode the JSON body of an incoming request.
+
+    Returns:
+        Tuple of the decoded payload and an error response to send instead, if any
+    """
     if request.content_type != 'application/json':
-        return False, 'Content-Type must be application/json'
-        
+        return None, json_response(
+            {'status': 'error', 'message': 'Content-Type must be application/json'},
+            status=400
+        )
+
+    too_large = {'status': 'error', 'message': f'Request body exceeds {MAX_BODY_SIZE} bytes'}
+    # Reject declared oversize bodies before reading them
+    if (request.content_length or 0) > MAX_BODY_SIZE:
+        return None, json_response(too_large, status=413)
+
     try:
-        await request.json()
-        return True, None
-    except json.JSONDecodeError:
-        return False, 'Invalid JSON payload'
+        body = await request.read()
+    except web.HTTPRequestEntityTooLarge:
+        # Raised for undeclared (chunked) bodies over client_max_size
+        return None, json_response(too_large, status=413)
+
+    try:
+        return orjson.loads(body), None
+    except orjson.JSONDecodeError:
+        return None, json_response(
+            {'status': 'error', 'message': 'Invalid JSON payload'},
+            status=400
+        )
 
 async def handle_request(request: web.Request) -> web.Response:
     """Handle incoming HTTP requests."""
     try:
-        # Validate request
-        is_valid, error_message = await validate_request(request)
-        if not is_valid:
-            return web.json_response(
-                {'status': 'error', 'message': error_message},
-                status=400
-            )
+        # Validate and decode request
+        data, error_response = await parse_request(request)
+        if error_response is not None:
+            return error_response
             
         # Process request with timeout
         try:
-            data = await request.json()
             server = request.app['jira_client']
             response = await asyncio.wait_for(
                 server.handle_mcp_message(data),
                 timeout=30
             )
-            return web.json_response(response)
+            return json_response(response)
         except asyncio.TimeoutError:
             logger.error('Request timed out')
-            return web.json_response(
+            return json_response(
                 {'status': 'error', 'message': 'Request timed out'},
                 status=504
             )          
     except Exception as e:
         logger.error(f'Unexpected error in handle_request: {str(e)}')
-        return web.json_response(
+        return json_response(
+            {'status': 'error', 'message': 'An unexpected error occurred'},
+            status=500
+        )
+
+async def handle_batch(request: web.Request) -> web.Response:
+    """Handle a batch of MCP messages in a single HTTP request."""
+    try:
+        # Validate and decode request
+        payload, error_response = await parse_request(request)
+        if error_response is not None:
+            return error_response
+
+        messages = payload.get('requests') if isinstance(payload, dict) else None
+        if not isinstance(messages, list) or not all(isinstance(m, dict) for m in messages):
+            return json_response(
+                {'status': 'error', 'message': 'Payload must contain a list of requests'},
+                status=400
+            )
+        if len(messages) > MAX_BATCH_SIZE:
+            return json_response(
+                {'status': 'error', 'message': f'Batch size exceeds the limit of {MAX_BATCH_SIZE}'},
+                status=400
+            )
+
+        # Process all messages concurrently, each with its own timeout
+        server = request.app['jira_client']
+        results = await asyncio.gather(
+            *(asyncio.wait_for(server.handle_mcp_message(m), timeout=30) for m in messages),
+            return_exceptions=True
+        )
+
+        responses = []
+        for message, result in zip(messages, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.error(f'Batch request {message.get("id")} timed out')
+                result = {'status': 'error', 'message': 'Request timed out'}
+            elif isinstance(result, BaseException):
+                result = {'status': 'error', 'message': str(result)}
+            responses.append({'id': message.get('id'), **result})
+        return json_response({'responses': responses})
+    except Exception as e:
+        logger.error(f'Unexpected error in handle_batch: {str(e)}')
+        return json_response(
             {'status': 'error', 'message': 'An unexpected error occurred'},
             status=500
         )
@@ -649,18 +971,22 @@ async def health_check(request: web.Request) -> web.Response:
     """Health check endpoint."""
     try:
         await request.app['jira_client'].test_connection()
-        return web.json_response({
+        return json_response({
             'status': 'healthy',
             'jira_connection': 'ok',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': iso_now()
         })
     except Exception as e:
-        return web.json_response({
+        return json_response({
             'status': 'unhealthy',
             'error': str(e),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': iso_now()
         }, status=500)
 
+async def startup(app):
+    """Initialize resources once the event loop is running."""
+    await app['jira_client'].setup()
+
 async def shutdown(app):
     """Cleanup resources before shutdown."""
     logger.info("Shutting down MCP server...")
@@ -668,31 +994,57 @@ async def shutdown(app):
     for ws in app['websockets']:
         await ws.close()
 
+async def cleanup(app):
+    """Release resources once in-flight requests have finished."""
+    await app['jira_client'].close()
+
+@web.middleware
+async def cors_middleware(request: web.Request, handler) -> web.StreamResponse:
+    """Answer CORS preflight requests and add CORS headers to responses."""
+    if request.method == 'OPTIONS':
+        return web.Response(status=204, headers=CORS_HEADERS)
+
+    try:
+        response = await handler(request)
+    except web.HTTPException as e:
+        e.headers.update(CORS_HEADERS)
+        raise
+    response.headers.update(CORS_HEADERS)
+    return response
+
 def setup_cors(app: web.Application) -> None:
     """Configure CORS."""
-    cors = aiohttp_cors.setup(app, defaults={
-        "*": aiohttp_cors.ResourceOptions(
-            allow_credentials=True,
-            expose_headers="*",
-            allow_headers="*",
-            allow_methods=["POST", "GET", "OPTIONS"]
-        )
-    })
-    
-    for route in list(app.router.routes()):
-        cors.add(route)
+    app.middlewares.append(cors_middleware)
 
 def main():
+    # Start writing queued log records
+    log_listener = create_log_listener()
+    log_listener.start()
+
     # Load configuration
     config = ServerConfig()
     
     # Initialize application
-    app = web.Application()
+    app = web.Application(client_max_size=MAX_BODY_SIZE)
+    
+    # Create static directory
+    static_dir = os.path.join(os.path.dirname(__file__), config.static_dir)
+    os.makedirs(static_dir, exist_ok=True)
     
     # Setup routes
     app.router.add_post('/mcp', handle_request)
+    app.router.add_post('/mcp/batch', handle_batch)
     app.router.add_get('/health', health_check)
-    app.router.add_static('/', path=os.path.join(os.path.dirname(__file__), config.static_dir))
+    # Static files are sent with sendfile(); a precompressed .gz next to a file
+    # is served instead when the client accepts gzip
+    app.router.add_static(
+        '/',
+        path=static_dir,
+        append_version=True,
+        show_index=False,
+        follow_symlinks=False,
+        chunk_size=65536
+    )
     
     # Setup CORS
     setup_cors(app)
@@ -701,16 +1053,22 @@ def main():
     app['websockets'] = []
     app['jira_client'] = MCPJiraServer()
     
-    # Setup cleanup
+    # Setup startup and cleanup
+    app.on_startup.append(startup)
     app.on_shutdown.append(shutdown)
+    app.on_cleanup.append(cleanup)
     
-    # Create static directory
-    static_dir = os.path.join(os.path.dirname(__file__), config.static_dir)
-    os.makedirs(static_dir, exist_ok=True)
-    
+    # Use the faster uvloop event loop when available
+    if uvloop is not None:
+        uvloop.install()
+
     # Start server
     logger.info(f"Starting MCP server on {config.host}:{config.port}")
-    web.run_app(app, host=config.host, port=config.port)
+    try:
+        web.run_app(app, host=config.host, port=config.port)
+    finally:
+        # Stop last so records from shutdown and cleanup are still written
+        log_listener.stop()
 
 if __name__ == '__main__':
     main()